@@ -1,10 +1,17 @@
 import os
+import sys
+import stat
 import httpx
 import asyncio
+import aiofiles
+import time
+import functools
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import List, Optional, Set
-import json
-import traceback
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
+import platformdirs
+import logging
+from logging.handlers import RotatingFileHandler
 import re
 
 from textual.app import App, ComposeResult
@@ -13,30 +20,194 @@ from textual.widgets import Header, Footer, Input, Button, Static, Markdown, Dat
 from textual.message import Message
 from textual import on, work
 from textual.binding import Binding
+from textual.timer import Timer
+from textual.worker import Worker, WorkerState
+
+# orjson is a faster drop-in for the Modrinth payloads; fall back to the stdlib if it's missing
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+    
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 # --- Constants & Config ---
 MODRINTH_API_URL = "https://api.modrinth.com/v2"
 USER_AGENT = "gemini-cli/plugin-browser/1.0 (gemini-cli-agent)"
 
+# Errors go to a size-capped error.log; delay=True so the file is only created on first error
+logger = logging.getLogger("plugin_browser")
+logger.setLevel(logging.ERROR)
+_log_handler = RotatingFileHandler("error.log", maxBytes=256_000, backupCount=2, delay=True)
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+logger.addHandler(_log_handler)
+
+# Idle time after the last keystroke before searching
+SEARCH_DEBOUNCE = 0.4
+# Results per search request, and how many loaded pages the results table retains
+SEARCH_PAGE_SIZE = 20
+MAX_RESULT_PAGES = 5
+
+# Outgoing API request budget: concurrent requests and per-request deadline (incl. queueing on the pool)
+MAX_CONCURRENT_REQUESTS = 5
+REQUEST_TIMEOUT = 8.0
+
+# Response cache: short TTL for search (results shift with downloads), longer for versions/projects
+CACHE_MAXSIZE = 256
+SEARCH_TTL = 60.0
+VERSIONS_TTL = 300.0
+PROJECT_TTL = 300.0
+# On-disk project cache, reused across runs; older entries are refetched
+PROJECT_CACHE_DIR = Path(platformdirs.user_cache_dir("plugin-browser")) / "projects"
+PROJECT_DISK_TTL = 86400.0
+
+# Markdown bodies beyond this many characters are rendered on demand
+DESCRIPTION_PREVIEW_CHARS = 4000
+# Download stream chunk and file buffer size; bounds memory per download regardless of jar size
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# How long past its TTL an entry may still be served while a refresh is in flight
+STALE_TTL = 300.0
+
+@functools.lru_cache(maxsize=32)
+def _facets_for(loaders: Tuple[str, ...]) -> str:
+    """Encoded search facets for a (sorted) loader tuple; reused across keystrokes and pages."""
+    facets = [["project_type:plugin"]]
+    if loaders:
+        facets.append([f"categories:{loader}" for loader in loaders])
+    return _json_dumps(facets)
+
+def _load_disk_cache(path: Path, max_age: float) -> Optional[Any]:
+    """Read and decode a cache file if it is younger than max_age seconds (blocking)."""
+    try:
+        if path.stat().st_mtime < time.time() - max_age:
+            return None
+        return _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+def _store_disk_cache(path: Path, data: bytes):
+    """Atomically write a cache file, ignoring I/O errors (blocking)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def _prune_disk_cache(directory: Path, max_age: float):
+    """Delete cache files older than max_age seconds, which would never be read again (blocking)."""
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
 # --- API Client ---
 class ModrinthAPI:
-    def __init__(self):
+    def __init__(self, on_error: Optional[Callable[[str], None]] = None):
+        # Single long-lived client: Textual runs one event loop for the app's lifetime,
+        # so the pool is reused across requests and only closed in on_unmount.
+        # http2/limits must go on the transport when one is passed explicitly.
         self.client = httpx.AsyncClient(
             base_url=MODRINTH_API_URL,
             headers={"User-Agent": USER_AGENT},
-            timeout=10.0
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0),
+                retries=1
+            )
         )
+        # key -> (fresh_until, hard_until, value), oldest first
+        self._cache: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # Shared across search, prefetch and dependency lookups to stay clear of Modrinth's rate limit
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.on_error = on_error
+        # Strong refs to fire-and-forget refreshes so they aren't garbage collected mid-flight
+        self._background_tasks: Set[asyncio.Task] = set()
+        # Requests currently on the wire, keyed like the cache
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def _get(self, path: str, **kwargs) -> httpx.Response:
+        """GET within the concurrency budget; raises on timeout or HTTP error."""
+        async with self._semaphore:
+            response = await asyncio.wait_for(self.client.get(path, **kwargs), timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response
+
+    def _report(self, action: str, error: Exception):
+        logger.error("%s failed", action, exc_info=error)
+        if self.on_error:
+            # Keep toasts short; httpx messages embed the URL and a docs link
+            if isinstance(error, httpx.HTTPStatusError):
+                reason = f"HTTP {error.response.status_code}"
+            else:
+                reason = str(error) or type(error).__name__
+            self.on_error(f"{action} failed: {reason}")
+
+    def _cache_peek(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """Return (value, is_fresh) for an entry that has not hard-expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        fresh_until, hard_until, value = entry
+        now = time.monotonic()
+        if now >= hard_until:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return value, now < fresh_until
+
+    def _cache_get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached value if present and still fresh."""
+        peeked = self._cache_peek(key)
+        if peeked is None or not peeked[1]:
+            return None
+        return peeked[0]
+
+    def _cache_set(self, key: Hashable, value: Any, ttl: float):
+        now = time.monotonic()
+        self._cache[key] = (now + ttl, now + ttl + STALE_TTL, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _search_key(query: str, loaders_key: Tuple[str, ...], limit: int, offset: int) -> tuple:
+        return ("search", query, loaders_key, limit, offset)
+
+    def peek_search(self, query: str, loaders: List[str], limit: int = 20, offset: int = 0) -> Optional[Tuple[List[dict], bool]]:
+        """Return cached search hits and whether they are fresh, without touching the network."""
+        peeked = self._cache_peek(self._search_key(query, tuple(sorted(loaders)), limit, offset))
+        if peeked is None:
+            return None
+        hits, fresh = peeked
+        return list(hits), fresh
 
     async def search_plugins(self, query: str, loaders: List[str], limit: int = 20, offset: int = 0) -> List[dict]:
         """Search for plugins on Modrinth."""
+        # Sorted once: shared by the response cache key and the memoized facets
+        loaders_key = tuple(sorted(loaders))
+        key = self._search_key(query, loaders_key, limit, offset)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
         try:
-            facets = [["project_type:plugin"]]
-            if loaders:
-                loader_facet = [f"categories:{loader}" for loader in loaders]
-                facets.append(loader_facet)
-            
-            facets_json = json.dumps(facets)
-            response = await self.client.get(
+            facets_json = _facets_for(loaders_key)
+            response = await self._get(
                 "/search",
                 params={
                     "query": query,
@@ -46,147 +217,279 @@ class ModrinthAPI:
                     "index": "relevance" 
                 }
             )
-            response.raise_for_status()
-            return response.json().get("hits", [])
-        except Exception:
-            return []
+            hits = _json_loads(response.content).get("hits", [])
+            self._cache_set(key, hits, SEARCH_TTL)
+            return list(hits)
+        except Exception as e:
+            self._report("Search", e)
+            # Serve a stale page over an empty one if the refresh failed
+            peeked = self._cache_peek(key)
+            return list(peeked[0]) if peeked else []
+
+    async def _coalesce(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch once per key at a time; concurrent callers (e.g. a prefetch and the
+        row selection that follows it) await the same in-flight request."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            
+            def forget(done: asyncio.Task):
+                self._inflight.pop(key, None)
+                # Callers report failures themselves; retrieve it in case none is left waiting
+                if not done.cancelled():
+                    done.exception()
+            
+            task.add_done_callback(forget)
+        # Shielded so a cancelled caller doesn't abort the request for the others
+        return await asyncio.shield(task)
 
-    async def get_project(self, project_slug_or_id: str) -> Optional[dict]:
-        """Get project details."""
+    def _discard_background(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        # Background refreshes fail silently; the cached copy keeps being served
+        if not task.cancelled():
+            task.exception()
+
+    async def get_project(self, project_slug_or_id: str, report: bool = True) -> Optional[dict]:
+        """Get project details; report=False keeps failures quiet for background work like prefetching."""
+        key = ("project", project_slug_or_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return dict(cached)
         try:
-            response = await self.client.get(f"/project/{project_slug_or_id}")
-            response.raise_for_status()
-            return response.json()
-        except Exception:
+            project = await self._coalesce(key, lambda: self._load_project(project_slug_or_id))
+        except Exception as e:
+            if report:
+                self._report(f"Loading project {project_slug_or_id}", e)
             return None
+        return dict(project)
+
+    async def _load_project(self, project_slug_or_id: str) -> dict:
+        # Fall back to the on-disk copy from a previous run, refreshing it in the background
+        path = PROJECT_CACHE_DIR / f"{Path(project_slug_or_id).name}.json"
+        project = await asyncio.to_thread(_load_disk_cache, path, PROJECT_DISK_TTL)
+        if project is not None:
+            self._cache_set(("project", project_slug_or_id), project, PROJECT_TTL)
+            task = asyncio.create_task(self._fetch_project(project_slug_or_id, path))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._discard_background)
+            return project
+        
+        return await self._fetch_project(project_slug_or_id, path)
 
-    async def get_versions(self, project_slug_or_id: str, loaders: List[str] = None) -> List[dict]:
-        """Get versions for a specific project, optionally filtered by loader."""
+    async def _fetch_project(self, project_slug_or_id: str, path: Path) -> dict:
+        response = await self._get(f"/project/{project_slug_or_id}")
+        # Project bodies can be hundreds of KB of Markdown; parse off the event loop
+        project = await asyncio.to_thread(_json_loads, response.content)
+        self._cache_set(("project", project_slug_or_id), project, PROJECT_TTL)
+        await asyncio.to_thread(_store_disk_cache, path, response.content)
+        return project
+
+    async def prune_disk_cache(self):
+        """Drop expired on-disk project entries so the cache directory doesn't grow without bound."""
+        await asyncio.to_thread(_prune_disk_cache, PROJECT_CACHE_DIR, PROJECT_DISK_TTL)
+
+    async def get_versions(self, project_slug_or_id: str, loaders: List[str] = None, report: bool = True) -> List[dict]:
+        """Get versions for a specific project, optionally filtered by loader; report as in get_project."""
+        key = ("versions", project_slug_or_id, tuple(sorted(loaders or ())))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
         try:
-            params = {}
-            if loaders:
-                # Modrinth API allows filtering versions by loader
-                # loaders=["paper", "spigot"] -> json string
-                params["loaders"] = json.dumps(loaders)
-            
-            response = await self.client.get(f"/project/{project_slug_or_id}/version", params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception:
+            versions = await self._coalesce(key, lambda: self._fetch_versions(key, project_slug_or_id, loaders))
+        except Exception as e:
+            if report:
+                self._report(f"Loading versions of {project_slug_or_id}", e)
             return []
+        return list(versions)
+
+    async def _fetch_versions(self, key: Hashable, project_slug_or_id: str, loaders: Optional[List[str]]) -> List[dict]:
+        params = {}
+        if loaders:
+            # Modrinth API allows filtering versions by loader
+            # loaders=["paper", "spigot"] -> json string
+            params["loaders"] = _json_dumps(loaders)
+        
+        response = await self._get(f"/project/{project_slug_or_id}/version", params=params)
+        versions = _json_loads(response.content)
+        self._cache_set(key, versions, VERSIONS_TTL)
+        return versions
     
     async def get_version(self, version_id: str) -> Optional[dict]:
         """Get a specific version."""
         try:
-            response = await self.client.get(f"/version/{version_id}")
-            response.raise_for_status()
-            return response.json()
-        except Exception:
+            response = await self._get(f"/version/{version_id}")
+            return _json_loads(response.content)
+        except Exception as e:
+            self._report(f"Loading version {version_id}", e)
             return None
 
     async def close(self):
+        for task in [*self._background_tasks, *self._inflight.values()]:
+            task.cancel()
         await self.client.aclose()
 
+    async def __aenter__(self) -> "ModrinthAPI":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
 # --- UI Components ---
 
+class _VersionInfo:
+    """Per-version entry of PluginDetails.versions_map; slotted since projects can have hundreds of versions."""
+    __slots__ = ('url', 'filename', 'data', 'req_deps_count', 'req_dep_ids', 'deps_text')
+
+    def __init__(self, url: str, filename: str, data: dict, req_deps_count: int, req_dep_ids: List[str]):
+        self.url = url
+        self.filename = filename
+        # Full version object, used for dependency checking on install
+        self.data = data
+        self.req_deps_count = req_deps_count
+        self.req_dep_ids = req_dep_ids
+        # Filled in by PluginDetails.set_dependency_names once names are fetched
+        self.deps_text: Optional[str] = None
+
+def _build_version_lists(versions: List[dict], allowed_loaders: List[str]) -> Tuple[list, dict]:
+    """Filter versions to the allowed loaders and build (select options, versions map).
+
+    Touches no widgets, so it can run in a worker thread.
+    """
+    # Keep versions with files whose loaders overlap the active filter. A version lists
+    # only a handful of loaders, so scanning its list beats building a set per version.
+    allowed = frozenset(allowed_loaders)
+    items = [(v, v.get('loaders') or ()) for v in versions if v.get('files')]
+    if allowed:
+        items = [(v, v_loaders) for v, v_loaders in items if any(l in allowed for l in v_loaders)]
+    
+    # Required dependencies are summarized up front so selecting a version doesn't rescan them
+    versions_map = {}
+    for v, _ in items:
+        req_deps = [d for d in v.get('dependencies') or () if d.get('dependency_type') == 'required']
+        versions_map[v['id']] = _VersionInfo(
+            v['files'][0]['url'],
+            v['files'][0]['filename'],
+            v,
+            len(req_deps),
+            [d['project_id'] for d in req_deps if d.get('project_id')]
+        )
+    select_options = [
+        (f"{v.get('name', v['version_number'])} ({', '.join(v_loaders)})", v['id'])
+        for v, v_loaders in items
+    ]
+    return select_options, versions_map
+
 class PluginDetails(Static):
     """Widget to display plugin details."""
     
     current_plugin: Optional[dict] = None
     versions_map: dict = {}
     current_version: Optional[dict] = None
+    _full_description: str = ""
 
     def compose(self) -> ComposeResult:
         with VerticalScroll():
             yield Label("Select a plugin to view details", id="details-title")
             yield Markdown("", id="details-desc")
+            yield Button("Show full description", id="btn-full-desc")
             yield Label("Dependencies:", classes="section-header", id="lbl-dependencies")
             yield Label("None", id="deps-list")
             yield Label("Versions:", classes="section-header")
             yield Select([], prompt="Select a version", id="version-select")
             yield Button("Download", variant="primary", id="btn-download", disabled=True)
 
-    def show_plugin(self, plugin: dict, versions: List[dict], allowed_loaders: List[str]):
+    def on_mount(self):
+        # Resolve child widgets once; the handlers below run on every plugin/version switch
+        self._title = self.query_one("#details-title", Label)
+        self._desc = self.query_one("#details-desc", Markdown)
+        self._full_desc_btn = self.query_one("#btn-full-desc", Button)
+        self._deps_label = self.query_one("#deps-list", Label)
+        self._version_select = self.query_one("#version-select", Select)
+        self._download_btn = self.query_one("#btn-download", Button)
+
+    def show_plugin(self, plugin: dict, select_options: list, versions_map: dict):
+        """Populate the pane; options and map come from _build_version_lists."""
         self.current_plugin = plugin
-        self.versions_map = {}
+        self.versions_map = versions_map
         self.current_version = None
-        
-        # Update Title
-        title = self.query_one("#details-title", Label)
+
         author = plugin.get('author', 'Unknown')
-        title.update(f"{plugin['title']} (by {author})")
-        
-        # Update Description
-        desc = self.query_one("#details-desc", Markdown)
         full_text = plugin.get('body') or plugin.get('description') or 'No description available.'
-        desc.update(full_text)
-        
-        # Reset dependencies
-        self.query_one("#deps-list", Label).update("Select a version to see dependencies")
+        # Large bodies are slow to parse and lay out; render a preview cut at a paragraph break
+        preview = full_text
+        if len(full_text) > DESCRIPTION_PREVIEW_CHARS:
+            cut = full_text.rfind("\n\n", 0, DESCRIPTION_PREVIEW_CHARS)
+            if cut < DESCRIPTION_PREVIEW_CHARS // 2:
+                cut = DESCRIPTION_PREVIEW_CHARS
+            preview = full_text[:cut] + "\n\n…"
+        self._full_description = full_text
 
-        # Filter versions
-        select_options = []
-        allowed_set = set(allowed_loaders)
-        
-        for version in versions:
-            v_loaders = set(version.get('loaders', []))
-            if allowed_set and not (v_loaders & allowed_set):
-                continue
-                
-            version_id = version['id']
-            name = version.get('name', version['version_number'])
-            files = version.get('files', [])
-            if not files:
-                continue
-                
-            # Store full version object for dependency checking
-            self.versions_map[version_id] = {
-                'url': files[0]['url'],
-                'filename': files[0]['filename'],
-                'data': version
-            }
+        # Apply all widget changes in one batch so the pane relayouts once
+        with self.app.batch_update():
+            # Update Title
+            self._title.update(f"{plugin['title']} (by {author})")
             
-            display_loaders = ", ".join(v_loaders)
-            label = f"{name} ({display_loaders})"
-            select_options.append((label, version_id))
-        
-        # Update Select
-        sel = self.query_one("#version-select", Select)
-        sel.set_options(select_options)
-        
-        # Reset Download Button
-        btn = self.query_one("#btn-download", Button)
-        btn.disabled = True
+            # Update Description
+            self._desc.update(preview)
+            self._full_desc_btn.display = preview is not full_text
+            
+            # Reset dependencies
+            self._deps_label.update("Select a version to see dependencies")
+            
+            # Update Select
+            self._version_select.set_options(select_options)
+            
+            # Reset Download Button
+            self._download_btn.disabled = True
+
+    @on(Button.Pressed, "#btn-full-desc")
+    def on_show_full_description(self, event: Button.Pressed):
+        event.stop()
+        self._desc.update(self._full_description)
+        event.button.display = False
 
     @on(Select.Changed)
     def on_version_select(self, event: Select.Changed):
-        btn = self.query_one("#btn-download", Button)
-        deps_lbl = self.query_one("#deps-list", Label)
+        btn = self._download_btn
+        deps_lbl = self._deps_label
         
         if event.value:
             btn.disabled = False
             version_id = event.value
             version_info = self.versions_map.get(version_id)
             if version_info:
-                self.current_version = version_info['data']
+                self.current_version = version_info.data
                 # Update dependencies display
-                dependencies = self.current_version.get('dependencies', [])
-                req_deps = [d for d in dependencies if d['dependency_type'] == 'required']
-                
-                if req_deps:
-                    # We only have project_ids, normally we'd need to fetch names, 
-                    # but for now let's just show count or ID. 
-                    # Ideally we fetch names async, but that's complex for this sync handler.
-                    # We'll just list them as "Required Dependency"
-                    deps_text = f"{len(req_deps)} required dependencies."
-                    deps_lbl.update(deps_text)
-                else:
-                    deps_lbl.update("No required dependencies.")
+                deps_lbl.update(self._deps_text(version_info))
         else:
             btn.disabled = True
             deps_lbl.update("-")
             self.current_version = None
 
+    @staticmethod
+    def _deps_text(version_info: _VersionInfo) -> str:
+        if version_info.deps_text:
+            return version_info.deps_text
+        if version_info.req_deps_count:
+            # Names arrive asynchronously; show the count until then
+            return f"{version_info.req_deps_count} required dependencies."
+        return "No required dependencies."
+
+    def set_dependency_names(self, versions_map: dict, names: dict):
+        """Store formatted dependency names on each version; project ids stand in for unknown names."""
+        if versions_map is not self.versions_map:
+            # Another plugin was shown while the names were loading
+            return
+        for info in versions_map.values():
+            if info.req_dep_ids:
+                info.deps_text = "Requires: " + ", ".join(names.get(pid, pid) for pid in info.req_dep_ids)
+        
+        if self.current_version is not None:
+            info = versions_map.get(self.current_version['id'])
+            if info:
+                self._deps_label.update(self._deps_text(info))
+
 class InstalledPlugins(Static):
     """Widget to manage installed plugins."""
     
@@ -296,16 +599,19 @@ class ModrinthBrowser(App):
         background: #292e42;
     }
 
-    #btn-load-more {
+    #btn-load-more, #btn-load-previous {
         margin: 1;
         background: #24283b;
         color: #7aa2f7;
         border: none;
     }
-    #btn-load-more:hover {
+    #btn-load-more:hover, #btn-load-previous:hover {
         background: #3d59a1;
         color: #ffffff;
     }
+    #btn-load-previous {
+        display: none;
+    }
     #btn-load-more:disabled {
         background: #1a1b26;
         color: #565f89;
@@ -333,6 +639,17 @@ class ModrinthBrowser(App):
         padding-bottom: 1;
     }
 
+    #btn-full-desc {
+        display: none;
+        background: #24283b;
+        color: #7aa2f7;
+        border: none;
+    }
+    #btn-full-desc:hover {
+        background: #3d59a1;
+        color: #ffffff;
+    }
+
     .section-header {
         margin-top: 2;
         margin-bottom: 1;
@@ -384,13 +701,40 @@ class ModrinthBrowser(App):
         Binding("/", "focus_search", "Search"),
     ]
 
+    # Filter checkbox id -> Modrinth loader name, in display order
+    _LOADER_IDS = (
+        ("chk-paper", "paper"),
+        ("chk-spigot", "spigot"),
+        ("chk-bukkit", "bukkit"),
+        ("chk-purpur", "purpur"),
+        ("chk-fabric", "fabric"),
+    )
+
     def __init__(self):
         super().__init__()
-        self.api = ModrinthAPI()
+        self.api = ModrinthAPI(on_error=lambda message: self.notify(message, severity="warning"))
+        # Downloads share the API client's pool; cap how many stream at once
+        self.download_semaphore = asyncio.Semaphore(3)
         self.download_dir = self._determine_download_dir()
         self.current_offset = 0
         self.current_query = ""
         self.search_timer: Optional[asyncio.TimerHandle] = None
+        self._search_work: Optional[Worker] = None
+        # (query, loaders, offset) of the search whose results are on screen; None after any other change
+        self._last_search_key: Optional[tuple] = None
+        self._hover_timer: Optional[Timer] = None
+        # Loaded result pages, oldest first, as (title, downloads, slug) rows in display order.
+        # Only MAX_RESULT_PAGES are kept; _first_offset is the search offset of the oldest one.
+        self._pages: Deque[List[Tuple[str, str, str]]] = deque()
+        self._first_offset = 0
+        self._seen_slugs: Set[str] = set()
+        # (slug, title) -> compiled filename matcher for check_plugin_exists
+        self._exists_patterns: dict = {}
+        # (download_dir mtime, [(jar name, size)]) from the last scan; None forces a rescan
+        self._jar_cache: Optional[Tuple[float, List[Tuple[str, int]]]] = None
+        # Loader filter state, kept in sync by _on_filter_toggle
+        self._loader_enabled: dict = {}
+        self._active_loaders: List[str] = []
 
     def _determine_download_dir(self) -> Path:
         cwd = Path.cwd()
@@ -398,10 +742,15 @@ class ModrinthBrowser(App):
             return cwd
         
         plugins_dir = cwd / "plugins"
-        if plugins_dir.exists() and plugins_dir.is_dir():
+        # One stat covers both "exists" and "is a directory"
+        try:
+            st = os.stat(plugins_dir)
+        except FileNotFoundError:
+            plugins_dir.mkdir()
             return plugins_dir
         
-        plugins_dir.mkdir(exist_ok=True)
+        if not stat.S_ISDIR(st.st_mode):
+            raise NotADirectoryError(f"{plugins_dir} exists but is not a directory")
         return plugins_dir
 
     def compose(self) -> ComposeResult:
@@ -422,6 +771,7 @@ class ModrinthBrowser(App):
                 )
                 yield Container(
                     Container(
+                        Button("Load Previous", variant="default", id="btn-load-previous"),
                         DataTable(id="results-table"),
                         Button("Load More", variant="default", id="btn-load-more", disabled=True),
                         id="results-pane"
@@ -434,16 +784,34 @@ class ModrinthBrowser(App):
         yield Footer()
 
     def on_mount(self):
-        table = self.query_one("#results-table", DataTable)
+        # Resolve widgets used on hot paths (keystrokes, searches, row selection) once
+        self._results_table = self.query_one("#results-table", DataTable)
+        self._load_more_btn = self.query_one("#btn-load-more", Button)
+        self._load_previous_btn = self.query_one("#btn-load-previous", Button)
+        self._search_input = self.query_one("#search-input", Input)
+        self._installed_table = self.query_one("#installed-table", DataTable)
+        self._delete_btn = self.query_one("#btn-delete-installed", Button)
+        self._details = self.query_one(PluginDetails)
+        
+        table = self._results_table
         table.cursor_type = "row"
-        table.add_columns("Plugin Name", "Downloads")
-        self.query_one("#search-input").focus()
+        # Column keys are needed to refresh cells of rows kept across a re-search
+        self._name_column, self._downloads_column = table.add_columns("Plugin Name", "Downloads")
+        for checkbox_id, loader in self._LOADER_IDS:
+            self._loader_enabled[loader] = self.query_one(f"#{checkbox_id}", Checkbox).value
+        self._rebuild_active_loaders()
+        self._search_input.focus()
         self.refresh_installed_list()
+        self.prune_project_cache()
+
+    @work(exclusive=True, group="maintenance")
+    async def prune_project_cache(self):
+        await self.api.prune_disk_cache()
 
     def action_focus_search(self):
         self.query_one("TabbedContent").active = "Browse Plugins" # Does this work? No, keys are "tab-1" etc usually unless id provided.
         # Actually TabPane labels are the keys usually.
-        self.query_one("#search-input").focus()
+        self._search_input.focus()
 
     @on(Input.Changed)
     def on_input_changed(self, event: Input.Changed):
@@ -451,47 +819,100 @@ class ModrinthBrowser(App):
         
         if self.search_timer:
             self.search_timer.stop()
+
+        # Keep at most one search in flight: drop the one for the previous keystroke
+        if self._search_work is not None and not self._search_work.is_finished:
+            self._search_work.cancel()
             
         if not query:
-            self.query_one("#results-table", DataTable).clear()
-            self.query_one("#btn-load-more", Button).disabled = True
+            self.current_query = ""
+            self._results_table.clear()
+            self._pages.clear()
+            self._first_offset = 0
+            self._last_search_key = None
+            self._seen_slugs.clear()
+            self._sync_load_previous()
+            self._load_more_btn.disabled = True
             return
 
-        self.search_timer = self.set_timer(0.2, lambda: self.trigger_auto_search(query))
+        self.search_timer = self.set_timer(SEARCH_DEBOUNCE, lambda: self.trigger_auto_search(query))
 
     def trigger_auto_search(self, query: str):
-        if query != self.current_query:
+        # A keystroke may have cancelled the search for this same query (e.g. backspace + retype)
+        interrupted = self._search_work is not None and self._search_work.state == WorkerState.CANCELLED
+        if query != self.current_query or interrupted:
             self.current_query = query
-            self.current_offset = 0
-            self.perform_search(reset=True)
+            self._start_new_search()
+
+    def _start_new_search(self):
+        """Search current_query from the top, keeping the old rows on screen until results arrive."""
+        # Paging off the old rows would mix them with the new query's pages
+        self._load_more_btn.disabled = True
+        self._load_previous_btn.display = False
+        # What's displayed is being replaced, so the repeat check mustn't skip this search
+        self._last_search_key = None
+        self.current_offset = 0
+        self._search_work = self.perform_search(self.current_query, reset=True)
 
     def get_active_loaders(self) -> List[str]:
-        loaders = []
-        if self.query_one("#chk-paper", Checkbox).value: loaders.append("paper")
-        if self.query_one("#chk-spigot", Checkbox).value: loaders.append("spigot")
-        if self.query_one("#chk-bukkit", Checkbox).value: loaders.append("bukkit")
-        if self.query_one("#chk-purpur", Checkbox).value: loaders.append("purpur")
-        if self.query_one("#chk-fabric", Checkbox).value: loaders.append("fabric")
-        return loaders
-
-    @work(exclusive=True)
-    async def perform_search(self, reset: bool = False):
+        return list(self._active_loaders)
+
+    def _rebuild_active_loaders(self):
+        self._active_loaders = [loader for _, loader in self._LOADER_IDS if self._loader_enabled.get(loader)]
+
+    @on(Checkbox.Changed)
+    def _on_filter_toggle(self, event: Checkbox.Changed):
+        loader = dict(self._LOADER_IDS).get(event.checkbox.id)
+        if loader is None:
+            return
+        self._loader_enabled[loader] = event.value
+        self._rebuild_active_loaders()
+        
+        # Filters changed: whatever is on screen is stale, so search again from the top
+        if self.current_query:
+            if self._search_work is not None and not self._search_work.is_finished:
+                self._search_work.cancel()
+            self._start_new_search()
+
+    @work(exclusive=True, group="search")
+    async def perform_search(self, query: str, reset: bool = False):
         try:
-            table = self.query_one("#results-table", DataTable)
-            if reset:
-                table.clear()
+            table = self._results_table
             
             loaders = self.get_active_loaders()
-            limit = 20
-            hits = await self.api.search_plugins(self.current_query, loaders, limit=limit, offset=self.current_offset)
+            limit = SEARCH_PAGE_SIZE
+            # Load More only advances current_offset once its page has landed, so a
+            # cancelled or empty request doesn't leave a gap
+            offset = self.current_offset if reset else self.current_offset + limit
+            search_key = (query, tuple(sorted(loaders)), offset)
+            if search_key == self._last_search_key:
+                # These exact results are already displayed (e.g. a spurious repeat event)
+                return
+            if reset:
+                # Stale-while-revalidate: paint a stale cached page now, then diff in the refresh
+                cached = self.api.peek_search(query, loaders, limit=limit, offset=offset)
+                if cached is not None and not cached[1]:
+                    with self.batch_update():
+                        self._replace_results(table, cached[0])
+            hits = await self.api.search_plugins(query, loaders, limit=limit, offset=offset)
+            if query != self.current_query:
+                # Superseded while waiting on the network
+                return
             
-            for hit in hits:
-                try:
-                    table.add_row(hit['title'], str(hit['downloads']), key=hit['slug'])
-                except Exception:
-                    pass
+            # An empty (or failed) next page must not evict a retained one
+            if reset or hits:
+                with self.batch_update():
+                    if reset:
+                        self._replace_results(table, hits)
+                    else:
+                        self._pages.append([])
+                        self._append_results(table, hits)
+                        self._evict_oldest_pages(table)
+                    self._sync_load_previous()
+                self.current_offset = offset
+                self._last_search_key = search_key
             
-            btn = self.query_one("#btn-load-more", Button)
+            btn = self._load_more_btn
             if len(hits) < limit:
                 btn.disabled = True
                 if not hits and reset:
@@ -499,8 +920,104 @@ class ModrinthBrowser(App):
             else:
                 btn.disabled = False
         except Exception as e:
-            with open("error.log", "w") as f:
-                f.write(traceback.format_exc())
+            logger.exception("Search failed")
+            self.notify(f"Search error: {e}", severity="error")
+
+    def _replace_results(self, table: DataTable, hits: List[dict]):
+        """Show a new result set, only touching rows that changed where possible."""
+        fresh = {hit['slug']: (hit['title'], str(hit['downloads']), hit['slug']) for hit in hits}
+        new_slugs = [hit['slug'] for hit in hits]
+        shown = [row for page in self._pages for row in page]
+        kept = [row for row in shown if row[2] in fresh]
+        
+        # DataTable can only append, so a diff keeps relevance order only if
+        # the surviving rows lead the new results; otherwise rebuild.
+        if new_slugs[:len(kept)] == [slug for _, _, slug in kept]:
+            for _, _, slug in shown:
+                if slug not in fresh:
+                    table.remove_row(slug)
+            # Surviving rows may carry an outdated title or download count
+            for i, (title, downloads, slug) in enumerate(kept):
+                kept[i] = fresh[slug]
+                new_title, new_downloads, _ = kept[i]
+                if new_title != title:
+                    table.update_cell(slug, self._name_column, new_title)
+                if new_downloads != downloads:
+                    table.update_cell(slug, self._downloads_column, new_downloads)
+        else:
+            table.clear()
+            kept = []
+        
+        self._pages = deque([kept])
+        self._first_offset = self.current_offset
+        # The table no longer shows the recorded search; the caller re-records it once final
+        self._last_search_key = None
+        self._seen_slugs = {slug for _, _, slug in kept}
+        self._append_results(table, hits[len(kept):])
+
+    def _new_rows(self, hits: List[dict]) -> List[Tuple[str, str, str]]:
+        """Table rows for hits not already shown, marking them as seen."""
+        # Pages can overlap when rankings shift between requests; skip rows already shown
+        rows = []
+        for hit in hits:
+            slug = hit['slug']
+            if slug not in self._seen_slugs:
+                self._seen_slugs.add(slug)
+                rows.append((hit['title'], str(hit['downloads']), slug))
+        return rows
+
+    def _append_results(self, table: DataTable, hits: List[dict]):
+        rows = self._new_rows(hits)
+        if not rows:
+            return
+        
+        # add_rows() can't take keys, so insert keyed rows under one batch_update instead
+        with self.batch_update():
+            for title, downloads, slug in rows:
+                table.add_row(title, downloads, key=slug)
+        self._pages[-1].extend(rows)
+
+    def _evict_oldest_pages(self, table: DataTable):
+        """Drop rows of pages beyond MAX_RESULT_PAGES so the table's memory stays bounded."""
+        while len(self._pages) > MAX_RESULT_PAGES:
+            for _, _, slug in self._pages.popleft():
+                table.remove_row(slug)
+                self._seen_slugs.discard(slug)
+            self._first_offset += SEARCH_PAGE_SIZE
+
+    def _sync_load_previous(self):
+        self._load_previous_btn.display = self._first_offset > 0
+
+    @work(exclusive=True, group="search")
+    async def load_previous_page(self, query: str):
+        """Bring back the page before the oldest retained one, dropping the newest if at capacity."""
+        try:
+            offset = max(self._first_offset - SEARCH_PAGE_SIZE, 0)
+            hits = await self.api.search_plugins(query, self.get_active_loaders(), limit=SEARCH_PAGE_SIZE, offset=offset)
+            if query != self.current_query or not hits:
+                return
+            
+            if len(self._pages) >= MAX_RESULT_PAGES:
+                for _, _, slug in self._pages.pop():
+                    self._seen_slugs.discard(slug)
+                # Load More will fetch the dropped page again
+                self.current_offset -= SEARCH_PAGE_SIZE
+                self._load_more_btn.disabled = False
+            
+            self._pages.appendleft(self._new_rows(hits))
+            self._first_offset = offset
+            self._last_search_key = None
+            
+            # DataTable can't insert above existing rows, so rebuild from the retained pages
+            table = self._results_table
+            with self.batch_update():
+                table.clear()
+                for page in self._pages:
+                    for title, downloads, slug in page:
+                        table.add_row(title, downloads, key=slug)
+                self._sync_load_previous()
+        except Exception as e:
+            logger.exception("Loading previous page failed")
             self.notify(f"Search error: {e}", severity="error")
 
     @on(Button.Pressed)
@@ -508,136 +1025,201 @@ class ModrinthBrowser(App):
         btn_id = event.button.id
         
         if btn_id == "btn-load-more":
-            self.current_offset += 20
-            self.perform_search(reset=False)
+            self._search_work = self.perform_search(self.current_query, reset=False)
+        
+        elif btn_id == "btn-load-previous":
+            self._search_work = self.load_previous_page(self.current_query)
             
         elif btn_id == "btn-download":
-            details = self.query_one(PluginDetails)
+            details = self._details
             if details.current_version:
                 self.start_install_process(details.current_version)
 
         elif btn_id == "btn-refresh-installed":
+            # An explicit refresh must rescan: the mtime cache misses in-place overwrites
+            self._jar_cache = None
             self.refresh_installed_list()
         
         elif btn_id == "btn-delete-installed":
-            self.delete_selected_plugin()
+            await self.delete_selected_plugin()
 
-    @work(thread=True)
-    def start_install_process(self, version_data: dict):
-        self.call_from_thread(self.notify, f"Starting installation...")
+    @work(exclusive=False, group="install")
+    async def start_install_process(self, version_data: dict):
+        self.notify(f"Starting installation...")
         
         # 1. Install the main plugin
         files = version_data.get('files', [])
         if not files:
-            self.call_from_thread(self.notify, "No files found for this version!", severity="error")
+            self.notify("No files found for this version!", severity="error")
             return
             
         main_file = files[0]
-        self.download_file_sync(main_file['url'], main_file['filename'])
+        tasks = [self.download_file(main_file['url'], main_file['filename'])]
         
-        # 2. Check Dependencies
+        # 2. Check Dependencies, resolving them while the main jar streams
         dependencies = version_data.get('dependencies', [])
         required_deps = [d for d in dependencies if d['dependency_type'] == 'required']
         
         if required_deps:
-            self.call_from_thread(self.notify, f"Checking {len(required_deps)} dependencies...")
-            self.call_from_thread(self.run_worker, self.process_dependencies(required_deps))
+            self.notify(f"Checking {len(required_deps)} dependencies...")
+            tasks.append(self.process_dependencies(required_deps))
+        
+        await asyncio.gather(*tasks)
 
-    def download_file_sync(self, url: str, filename: str):
+    async def download_file(self, url: str, filename: str):
+        # Never trust a remote filename with path components (e.g. "../")
+        safe_name = Path(filename).name
+        if safe_name in ("", ".", ".."):
+            self.notify(f"Refusing to install {filename!r}: invalid filename", severity="error")
+            return
+        filename = safe_name
         dest = self.download_dir / filename
         # Check if already exists? Modrinth files might change but filename usually unique per version
         # If exists, maybe skip? But 'install' implies force.
         
+        # Stream into a .part file and rename on completion, so an interrupted
+        # download never leaves a truncated .jar for the server to load
+        part = dest.with_name(filename + ".part")
         try:
-            with httpx.Client() as client:
-                resp = client.get(url)
-                resp.raise_for_status()
-                with open(dest, "wb") as f:
-                    f.write(resp.content)
-            self.call_from_thread(self.notify, f"Installed {filename}", severity="information")
-            self.call_from_thread(self.refresh_installed_list)
+            async with self.download_semaphore:
+                async with self.api.client.stream("GET", url) as resp:
+                    resp.raise_for_status()
+                    async with aiofiles.open(part, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                        async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            await f.write(chunk)
+            os.replace(part, dest)
+            self._jar_cache = None
+            self.notify(f"Installed {filename}", severity="information")
+            self.refresh_installed_list()
         except Exception as e:
-            self.call_from_thread(self.notify, f"Failed to install {filename}: {e}", severity="error")
+            self.notify(f"Failed to install {filename}: {e}", severity="error")
+        finally:
+            if part.exists():
+                part.unlink()
 
     async def process_dependencies(self, dependencies: List[dict]):
-        # This runs in the main loop context but is async
-        for dep in dependencies:
-            project_id = dep.get('project_id')
-            if not project_id:
-                continue
-                
-            # Get project info to find name
-            project = await self.api.get_project(project_id)
-            if not project:
+        # This runs in the main loop context but is async.
+        # Look up all dependency projects at once, then all missing ones' versions.
+        project_ids = list(dict.fromkeys(d['project_id'] for d in dependencies if d.get('project_id')))
+        projects = await asyncio.gather(
+            *(self.api.get_project(project_id) for project_id in project_ids),
+            return_exceptions=True
+        )
+        
+        # One directory scan, off the event loop, serves every existence check below
+        try:
+            jars = await asyncio.to_thread(self._list_jars)
+        except OSError:
+            jars = []
+        
+        needed = []
+        for project_id, project in zip(project_ids, projects):
+            if not project or isinstance(project, Exception):
                 continue
-                
             slug = project.get('slug')
             title = project.get('title')
             
             # Check if exists
-            if self.check_plugin_exists(slug, title):
+            if self.check_plugin_exists(slug, title, jars):
                 self.notify(f"Dependency '{title}' detected. Skipping.")
                 continue
             
             self.notify(f"Dependency '{title}' missing. Finding compatible version...")
-            
-            # Find version
-            # Use active loaders
-            loaders = self.get_active_loaders()
-            versions = await self.api.get_versions(project_id, loaders)
-            
-            if versions:
-                # Pick latest
-                best_version = versions[0]
-                files = best_version.get('files', [])
-                if files:
-                    file_info = files[0]
-                    self.notify(f"Downloading dependency: {title}")
-                    
-                    # We need to run download in thread again
-                    self.download_dependency_worker(file_info['url'], file_info['filename'])
-            else:
-                 self.notify(f"Could not find compatible version for dependency '{title}'", severity="warning")
-
-    @work(thread=True)
-    def download_dependency_worker(self, url: str, filename: str):
-        self.download_file_sync(url, filename)
+            needed.append((project_id, title))
+        
+        # Find versions, using active loaders
+        loaders = self.get_active_loaders()
+        versions_lists = await asyncio.gather(
+            *(self.api.get_versions(project_id, loaders) for project_id, _ in needed)
+        )
+        
+        downloads = []
+        for (project_id, title), versions in zip(needed, versions_lists):
+            if not versions:
+                self.notify(f"Could not find compatible version for dependency '{title}'", severity="warning")
+                continue
+            # Pick latest
+            files = versions[0].get('files', [])
+            if files:
+                self.notify(f"Downloading dependency: {title}")
+                downloads.append(self.download_file(files[0]['url'], files[0]['filename']))
+        
+        # download_file holds download_semaphore, so this fans out at most 3 at a time
+        await asyncio.gather(*downloads)
 
-    def check_plugin_exists(self, slug: str, title: str) -> bool:
-        # Check files in download_dir
+    def check_plugin_exists(self, slug: str, title: str, jars: List[Tuple[str, int]]) -> bool:
+        # Check files in download_dir, as listed by _list_jars
         # simple check: filename contains slug or title (case insensitive)
-        # Regex check as requested
-        # escape special chars
-        patterns = [
-            re.compile(re.escape(slug), re.IGNORECASE),
-            re.compile(re.escape(title), re.IGNORECASE)
-        ]
+        # Regex check as requested: one escaped alternation, compiled once per (slug, title)
+        needles = [n for n in (slug, title) if n]
+        if not needles:
+            return False
+        key = (slug, title)
+        pattern = self._exists_patterns.get(key)
+        if pattern is None:
+            pattern = re.compile("|".join(re.escape(n) for n in needles), re.IGNORECASE)
+            self._exists_patterns[key] = pattern
+        folded = [n.casefold() for n in needles]
         
-        try:
-            for file in self.download_dir.iterdir():
-                if file.is_file() and file.suffix == ".jar":
-                    for pat in patterns:
-                        if pat.search(file.name):
-                            return True
-        except Exception:
-            pass
+        for name, _ in jars:
+            # Cheap substring test first; the regex catches case-folding edge cases
+            name_cf = name.casefold()
+            if any(n in name_cf for n in folded) or pattern.search(name):
+                return True
         return False
 
-    def refresh_installed_list(self):
+    def _list_jars(self) -> List[Tuple[str, int]]:
+        """(name, size) of jar files in download_dir, rescanned only when the directory's mtime changes."""
+        mtime = os.stat(self.download_dir).st_mtime
+        if self._jar_cache is not None and self._jar_cache[0] == mtime:
+            return self._jar_cache[1]
+        # scandir's DirEntry answers is_file() from readdir data and caches its stat
+        with os.scandir(self.download_dir) as it:
+            jars = [
+                (entry.name, entry.stat().st_size)
+                for entry in it
+                if entry.name.endswith(".jar") and entry.is_file()
+            ]
+        self._jar_cache = (mtime, jars)
+        return jars
+
+    @work(exclusive=True, group="installed")
+    async def refresh_installed_list(self):
         try:
-            table = self.query_one("#installed-table", DataTable)
-            table.clear()
+            table = self._installed_table
+            # Scanning a large plugins folder must not stall keystroke handling
+            jars = await asyncio.to_thread(self._list_jars)
+            rows = [(name, f"{size / 1024:.2f}") for name, size in jars]
             
-            for file in self.download_dir.iterdir():
-                if file.is_file() and file.suffix == ".jar":
-                    size_kb = file.stat().st_size / 1024
-                    table.add_row(file.name, f"{size_kb:.2f}", key=file.name)
+            # Rows are keyed by filename for deletion, so add_row under one batch_update
+            with self.batch_update():
+                table.clear()
+                for name, size_kb in rows:
+                    table.add_row(name, size_kb, key=name)
         except Exception:
             pass
 
     @on(DataTable.RowSelected, selector="#installed-table")
     def on_installed_selected(self, event: DataTable.RowSelected):
-        self.query_one("#btn-delete-installed", Button).disabled = False
+        self._delete_btn.disabled = False
+
+    @on(DataTable.RowHighlighted, selector="#results-table")
+    def on_plugin_highlighted(self, event: DataTable.RowHighlighted):
+        if self._hover_timer:
+            self._hover_timer.stop()
+        plugin_slug = event.row_key.value
+        if plugin_slug is None:
+            return
+        self._hover_timer = self.set_timer(0.15, lambda: self.prefetch_plugin(plugin_slug))
+
+    @work(exclusive=True, group="prefetch")
+    async def prefetch_plugin(self, plugin_slug: str):
+        """Warm the API cache for the highlighted row so selecting it is served from memory."""
+        # Nobody is waiting on these yet, so failures stay quiet; selecting the row retries and reports
+        await asyncio.gather(
+            self.api.get_versions(plugin_slug, report=False),
+            self.api.get_project(plugin_slug, report=False)
+        )
 
     @on(DataTable.RowSelected, selector="#results-table")
     async def on_plugin_selected(self, event: DataTable.RowSelected):
@@ -645,18 +1227,38 @@ class ModrinthBrowser(App):
         loaders = self.get_active_loaders()
         self.fetch_plugin_details(plugin_slug, loaders)
 
-    @work(exclusive=True)
+    @work(exclusive=True, group="details")
     async def fetch_plugin_details(self, plugin_slug: str, loaders: List[str]):
-        versions = await self.api.get_versions(plugin_slug)
+        versions, project = await asyncio.gather(
+            self.api.get_versions(plugin_slug),
+            self.api.get_project(plugin_slug),
+            return_exceptions=True
+        )
+        for result in (versions, project):
+            if isinstance(result, Exception):
+                self.notify(f"Error loading details: {result}", severity="error")
+                return
         try:
-             project = await self.api.get_project(plugin_slug)
              if project:
-                 self.query_one(PluginDetails).show_plugin(project, versions, loaders)
+                 select_options, versions_map = await asyncio.to_thread(_build_version_lists, versions, loaders)
+                 details = self._details
+                 details.show_plugin(project, select_options, versions_map)
+                 
+                 # Resolve every required dependency's name once per plugin (served from the
+                 # project cache when repeated), so picking a version needs no further I/O
+                 dep_ids = list(dict.fromkeys(
+                     pid for info in versions_map.values() for pid in info.req_dep_ids
+                 ))
+                 if dep_ids:
+                     # A failed lookup just shows the project id, so don't report it
+                     dep_projects = await asyncio.gather(*(self.api.get_project(pid, report=False) for pid in dep_ids))
+                     names = {pid: p['title'] for pid, p in zip(dep_ids, dep_projects) if p and p.get('title')}
+                     details.set_dependency_names(versions_map, names)
         except Exception as e:
             self.notify(f"Error loading details: {e}", severity="error")
 
-    def delete_selected_plugin(self):
-        table = self.query_one("#installed-table", DataTable)
+    async def delete_selected_plugin(self):
+        table = self._installed_table
         try:
             # Get selected row
             # Textual 0.40+ changed how selections work slightly but cursor_row should work
@@ -679,11 +1281,16 @@ class ModrinthBrowser(App):
                 filename = row_key.value
                 
                 file_path = self.download_dir / filename
-                if file_path.exists():
-                    os.remove(file_path)
-                    self.notify(f"Deleted {filename}")
+                try:
+                    await asyncio.to_thread(os.remove, file_path)
+                except FileNotFoundError:
+                    # Already gone; the listing was stale
                     self.refresh_installed_list()
-                    self.query_one("#btn-delete-installed", Button).disabled = True
+                    return
+                self._jar_cache = None
+                self.notify(f"Deleted {filename}")
+                self.refresh_installed_list()
+                self._delete_btn.disabled = True
         except Exception as e:
             self.notify(f"Error deleting: {e}", severity="error")
 
@@ -691,5 +1298,14 @@ class ModrinthBrowser(App):
         await self.api.close()
 
 if __name__ == "__main__":
+    # uvloop is an optional faster event loop; it isn't available on Windows.
+    # Passed to run() directly, since uvloop.install() is deprecated on Python 3.12+.
+    loop = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            pass
     app = ModrinthBrowser()
-    app.run()
\ No newline at end of file
+    app.run(loop=loop)
\ No newline at end of file